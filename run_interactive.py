@@ -1,148 +1,506 @@
 """
 Interactive runner for introduction.py examples
-Just uncomment the section you want to run
+Pick the example to run with --example (see --help)
 """
 
+import asyncio
+import hashlib
+import json
+import shelve
 import sys
 import os
-from typing import Dict, List, Optional
-import nest_asyncio
-from pydantic import BaseModel, Field
-from pydantic_ai import Agent, ModelRetry, RunContext, Tool
-from pydantic_ai.models.openai import OpenAIModel
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic_core import from_json
 
 # Add src directory to path if needed
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-from src.utils.markdown import to_markdown
 
-# Apply nest_asyncio to allow nested event loops
-nest_asyncio.apply()
+# pydantic_ai, openai and the helpers in src are imported where they are used,
+# so importing this module stays cheap and each example only pays for itself
 
-# Initialize the model
-model = OpenAIModel("gpt-4o")
+# Only patch the event loop when imported into a running one (e.g. Jupyter)
+try:
+    _running_loop = asyncio.get_running_loop()
+except RuntimeError:
+    _running_loop = None
+else:
+    import nest_asyncio
+
+    nest_asyncio.apply()
+
+MODEL_NAME = "gpt-4o"
+
+# "sync" runs prompts live; "batch" sends prompt batches through OpenAI's Batch API.
+# Batch mode only covers the simple example run with more than one prompt.
+EXAMPLES_MODES = ("sync", "batch")
+EXAMPLES_MODE = os.getenv("EXAMPLES_MODE", "sync")
+if EXAMPLES_MODE not in EXAMPLES_MODES:
+    raise ValueError(
+        f"EXAMPLES_MODE must be one of {', '.join(EXAMPLES_MODES)}, got {EXAMPLES_MODE!r}"
+    )
+
+@lru_cache(maxsize=None)
+def _openai_client():
+    """OpenAI client with a connection pool wide enough for concurrent runs"""
+    import httpx
+    from openai import AsyncOpenAI
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=1024, max_keepalive_connections=512),
+        timeout=httpx.Timeout(120.0),
+    )
+    return AsyncOpenAI(http_client=http_client)
+
+@lru_cache(maxsize=None)
+def _model():
+    """Initialize the model on the shared OpenAI client"""
+    from pydantic_ai.models.openai import OpenAIModel
+
+    return OpenAIModel(MODEL_NAME, openai_client=_openai_client())
+
+async def warm_up_connection():
+    """Open a pooled connection to the OpenAI API ahead of the first agent run"""
+    try:
+        await _openai_client().models.list()
+    except Exception:
+        # Best effort only; the real request will surface any configuration error
+        pass
+
+# In a notebook, prime the shared client's pool while the user picks an example.
+# Keep a reference so the task isn't garbage-collected before it finishes.
+_warm_up_task = None
+if _running_loop is not None:
+    _warm_up_task = _running_loop.create_task(warm_up_connection())
+
+# ===============================================================
+# Shared schemas
+# ===============================================================
+
+class ResponseModel(BaseModel):
+    """Structured response with metadata."""
+
+    response: str
+    needs_escalation: bool
+    follow_up_required: bool
+    sentiment: str = Field(description="Customer sentiment analysis")
+
+# Define order schema
+class Order(BaseModel):
+    """Structure for order details."""
+
+    model_config = ConfigDict(frozen=True)
+
+    order_id: str
+    status: str
+    items: tuple[str, ...]
+
+# Define customer schema
+class CustomerDetails(BaseModel):
+    """Structure for incoming customer queries.
+
+    Frozen, with tuples instead of lists, so the cached dump and markdown
+    below always match the fields.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    customer_id: str
+    name: str
+    email: str
+    orders: Optional[tuple[Order, ...]] = None
+
+    def model_copy(self, *, update=None, deep=False):
+        copied = super().model_copy(update=update, deep=deep)
+        # The copy may have different fields, so drop the cached renderings
+        copied.__dict__.pop("dump", None)
+        copied.__dict__.pop("markdown", None)
+        return copied
+
+    @cached_property
+    def dump(self) -> dict:
+        """model_dump() computed once and shared by the prompt and cache paths"""
+        # JSON mode turns the tuples back into lists for to_markdown and the cache key
+        return self.model_dump(mode="json")
+
+    @cached_property
+    def markdown(self) -> str:
+        """Markdown rendering reused by every system prompt call for this customer"""
+        from src.utils.markdown import to_markdown
+
+        return to_markdown(self.dump)
 
 def separator():
     """Print a separator for better readability"""
     print("\n" + "="*60 + "\n")
 
-# Uncomment the section you want to run
+def print_response_details(customer, data):
+    """Print a structured response and its summary from a single model_dump()"""
+    details = data.model_dump()
+    print("\nStructured response:")
+    print(json.dumps(details, indent=2))
+
+    print(
+        "\nCustomer Details:\n"
+        f"Name: {customer.name}\n"
+        f"Email: {customer.email}\n\n"
+        "Response Details:\n"
+        f"{details['response']}\n\n"
+        "Status:\n"
+        f"Follow-up Required: {details['follow_up_required']}\n"
+        f"Needs Escalation: {details['needs_escalation']}"
+    )
+
+# Disk cache of agent results so re-running the script skips identical requests.
+# Set AGENT_CACHE=0 (or pass --no-cache) to always call the model.
+_CACHE_PATH = os.path.join(os.path.dirname(__file__), ".agent_cache")
+USE_CACHE = os.getenv("AGENT_CACHE", "1") != "0"
+
+@dataclass
+class CachedRunResult:
+    """Run result rebuilt from the disk cache, with the accessors the examples use"""
+
+    data: Any
+    messages: list
+    new_message_index: int
+    run_cost: Any
+
+    def all_messages(self):
+        return self.messages
+
+    def new_messages(self):
+        return self.messages[self.new_message_index:]
+
+    def cost(self):
+        return self.run_cost
+
+def _dump_result(response, result_type):
+    """Serialize a run result to JSON so cache entries don't depend on import paths"""
+    return json.dumps(
+        {
+            "data": TypeAdapter(result_type).dump_python(response.data, mode="json"),
+            "messages": response.all_messages_json().decode(),
+            "new_message_index": len(response.all_messages()) - len(response.new_messages()),
+            "cost": asdict(response.cost()),
+        }
+    )
+
+def _load_result(entry, result_type):
+    """Rebuild a cached run result written by _dump_result"""
+    from pydantic_ai.messages import ModelMessagesTypeAdapter
+    from pydantic_ai.result import Cost
+
+    entry = json.loads(entry)
+    return CachedRunResult(
+        data=TypeAdapter(result_type).validate_python(entry["data"]),
+        messages=ModelMessagesTypeAdapter.validate_json(entry["messages"]),
+        new_message_index=entry["new_message_index"],
+        run_cost=Cost(**entry["cost"]),
+    )
+
+async def cached_run(agent, user_prompt, deps=None, result_type=str):
+    """Run the agent, reusing a previous result for the same model, prompts and deps
+
+    The system prompts are read from the agent itself so the key always matches
+    what is sent. pydantic_ai keeps them in a private attribute, so if it is
+    missing the run simply skips the cache.
+    """
+    system_prompts = getattr(agent, "_system_prompts", None)
+    if not USE_CACHE or system_prompts is None:
+        return await agent.run(user_prompt=user_prompt, deps=deps)
+
+    key = hashlib.sha256(
+        json.dumps(
+            [
+                MODEL_NAME,
+                list(system_prompts),
+                user_prompt,
+                deps.dump if deps is not None else None,
+                result_type.__name__,
+            ]
+        ).encode()
+    ).hexdigest()
+    try:
+        with shelve.open(_CACHE_PATH) as cache:
+            if key in cache:
+                return _load_result(cache[key], result_type)
+    except Exception:
+        # An unreadable or outdated entry is just a cache miss
+        pass
+
+    response = await agent.run(user_prompt=user_prompt, deps=deps)
+    try:
+        with shelve.open(_CACHE_PATH) as cache:
+            cache[key] = _dump_result(response, result_type)
+    except Exception:
+        # Failing to cache shouldn't lose a result that has already been paid for
+        pass
+    return response
+
+async def run_batch(agent, prompts, max_concurrency=32):
+    """Run the agent over many prompts with at most max_concurrency in flight"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(prompt):
+        async with semaphore:
+            return await agent.run(prompt)
+
+    return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
+
+async def run_via_openai_batch(system_prompt, prompts, poll_interval=30.0):
+    """Answer prompts through OpenAI's Batch API and return the texts in order
+
+    Batches cost half as much and do not count against live rate limits, but
+    may take up to 24 hours, so this is meant for offline or CI runs.
+    Requests that fail inside the batch come back as None.
+    """
+    client = _openai_client()
+
+    requests = [
+        json.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL_NAME,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                },
+            }
+        )
+        for i, prompt in enumerate(prompts)
+    ]
+    batch_input = await client.files.create(
+        file=("batch_input.jsonl", "\n".join(requests).encode()), purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    answers = {}
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            result = json.loads(line)
+            if result.get("response") and result["response"]["status_code"] == 200:
+                body = result["response"]["body"]
+                answers[result["custom_id"]] = body["choices"][0]["message"]["content"]
+    return [answers.get(str(i)) for i in range(len(prompts))]
 
 # ===============================================================
 # 1. Simple Agent - Hello World Example
 # ===============================================================
 
-def run_simple_agent():
-    """Run the simple agent example"""
+SIMPLE_SYSTEM_PROMPT = "You are a helpful customer support agent. Be concise and friendly."
+
+@lru_cache(maxsize=None)
+def _simple_agent():
+    """Build the simple agent once and reuse it across runs"""
+    from pydantic_ai import Agent
+
+    return Agent(
+        model=_model(),
+        system_prompt=SIMPLE_SYSTEM_PROMPT,
+    )
+
+async def run_simple_agent(needs_llm=False, prompts=None, stream=True):
+    """Run the simple agent example
+
+    The follow-up question only asks for the previous prompt, which is already
+    in the message history, so it is answered locally unless needs_llm is set.
+    Passing prompts runs the agent over all of them concurrently instead.
+    With stream set the answer is printed as it arrives, bypassing the cache.
+    """
+    from pydantic_ai.messages import UserPromptPart
+
     print("Running Simple Agent Example...")
     
-    agent1 = Agent(
-        model=model,
-        system_prompt="You are a helpful customer support agent. Be concise and friendly.",
-    )
+    agent1 = _simple_agent()
+
+    if prompts is not None:
+        if EXAMPLES_MODE == "batch":
+            answers = await run_via_openai_batch(SIMPLE_SYSTEM_PROMPT, prompts)
+        else:
+            answers = [response.data for response in await run_batch(agent1, prompts)]
+        for prompt, answer in zip(prompts, answers):
+            print(f"{prompt}\n{answer}\n")
+        return answers
 
     # Example usage of basic agent
-    response = agent1.run_sync("How can I track my order #12345?")
-    print("Response data:")
-    print(response.data)
+    if stream:
+        async with agent1.run_stream("How can I track my order #12345?") as response:
+            print("Response data:")
+            # delta=True never records the reply in the message history, so stream
+            # the full text and print only what is new
+            printed = ""
+            async for text in response.stream_text():
+                print(text[len(printed):], end="", flush=True)
+                printed = text
+            print()
+    else:
+        response = await cached_run(agent1, "How can I track my order #12345?")
+        print("Response data:")
+        print(response.data)
     print("\nAll messages:")
     print(response.all_messages())
     print("\nCost:")
     print(response.cost())
 
     separator()
-    
-    response2 = agent1.run_sync(
-        user_prompt="What was my previous question?",
-        message_history=response.new_messages(),
+
+    if needs_llm:
+        response2 = await agent1.run(
+            user_prompt="What was my previous question?",
+            message_history=response.new_messages(),
+        )
+        print("Response to follow-up question:")
+        print(response2.data)
+        return response2
+
+    previous_question = next(
+        part.content
+        for message in response.new_messages()
+        for part in message.parts
+        if isinstance(part, UserPromptPart)
     )
     print("Response to follow-up question:")
-    print(response2.data)
+    print(f"Your previous question was: {previous_question}")
 
-# Uncomment to run
-# run_simple_agent()
+    return response
 
 # ===============================================================
 # 2. Agent with Structured Response
 # ===============================================================
 
-def run_structured_response():
-    """Run the structured response example"""
-    print("Running Structured Response Example...")
-    
-    class ResponseModel(BaseModel):
-        """Structured response with metadata."""
+STRUCTURED_SYSTEM_PROMPT = (
+    "You are an intelligent customer support agent. "
+    "Analyze queries carefully and provide structured responses."
+)
 
-        response: str
-        needs_escalation: bool
-        follow_up_required: bool
-        sentiment: str = Field(description="Customer sentiment analysis")
+@lru_cache(maxsize=None)
+def _structured_agent():
+    """Build the structured response agent once and reuse it across runs"""
+    from pydantic_ai import Agent
 
-    agent2 = Agent(
-        model=model,
+    return Agent(
+        model=_model(),
         result_type=ResponseModel,
-        system_prompt=(
-            "You are an intelligent customer support agent. "
-            "Analyze queries carefully and provide structured responses."
-        ),
+        system_prompt=STRUCTURED_SYSTEM_PROMPT,
     )
 
-    response = agent2.run_sync("How can I track my order #12345?")
+def _partial_response_text(message):
+    """Return the "response" text streamed so far in a partial ResponseModel tool call"""
+    from pydantic_ai.messages import ArgsDict, ToolCallPart
+
+    for part in message.parts:
+        if isinstance(part, ToolCallPart):
+            if isinstance(part.args, ArgsDict):
+                args = part.args.args_dict
+            else:
+                args = from_json(part.args.args_json or "{}", allow_partial="trailing-strings")
+            text = args.get("response") if isinstance(args, dict) else None
+            return text if isinstance(text, str) else ""
+    return ""
+
+async def run_structured_response(prompts=None, stream=True):
+    """Run the structured response example, or a concurrent batch of prompts
+
+    With stream set the response text is printed as it is generated and the
+    validated model is printed once complete, bypassing the cache.
+    """
+    print("Running Structured Response Example...")
+    
+    agent2 = _structured_agent()
+
+    if prompts is not None:
+        if EXAMPLES_MODE == "batch":
+            print("EXAMPLES_MODE=batch does not support structured output; running live")
+        responses = await run_batch(agent2, prompts)
+        for prompt, response in zip(prompts, responses):
+            print(f"{prompt}\n{response.data.model_dump_json(indent=2)}\n")
+        return responses
+
+    if stream:
+        async with agent2.run_stream("How can I track my order #12345?") as response:
+            printed = 0
+            async for message, is_last in response.stream_structured(debounce_by=None):
+                if is_last:
+                    data = await response.validate_structured_result(message)
+                    text = data.response
+                else:
+                    # ResponseModel can't validate until every field has arrived, so
+                    # read the growing "response" value from the partial JSON instead
+                    text = _partial_response_text(message)
+                print(text[printed:], end="", flush=True)
+                printed = max(printed, len(text))
+            print()
+    else:
+        response = await cached_run(
+            agent2,
+            "How can I track my order #12345?",
+            result_type=ResponseModel,
+        )
+        data = response.data
     print("Structured response:")
-    print(response.data.model_dump_json(indent=2))
+    print(data.model_dump_json(indent=2))
 
-# Uncomment to run
-# run_structured_response()
+    return response
 
 # ===============================================================
 # 3. Agent with Structured Response & Dependencies
 # ===============================================================
 
-def run_dependencies_example():
-    """Run the dependencies example"""
-    print("Running Dependencies Example...")
-    
-    class ResponseModel(BaseModel):
-        """Structured response with metadata."""
-
-        response: str
-        needs_escalation: bool
-        follow_up_required: bool
-        sentiment: str = Field(description="Customer sentiment analysis")
-
-    # Define order schema
-    class Order(BaseModel):
-        """Structure for order details."""
+# Shared by the dependencies and tools agents; variants only append to it so
+# every request starts with the same prefix and can hit OpenAI's prompt cache
+BASE_SYSTEM_PROMPT = (
+    "You are an intelligent customer support agent. "
+    "Analyze queries carefully and provide structured responses. "
+    "Always great the customer and provide a helpful response."
+)
 
-        order_id: str
-        status: str
-        items: List[str]
+DEPENDENCIES_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT
 
-    # Define customer schema
-    class CustomerDetails(BaseModel):
-        """Structure for incoming customer queries."""
-
-        customer_id: str
-        name: str
-        email: str
-        orders: Optional[List[Order]] = None
+@lru_cache(maxsize=None)
+def _dependencies_agent():
+    """Build the dependencies agent once so its system prompt is registered once"""
+    from pydantic_ai import Agent, RunContext
 
     # Agent with structured output and dependencies
-    agent5 = Agent(
-        model=model,
+    agent = Agent(
+        model=_model(),
         result_type=ResponseModel,
         deps_type=CustomerDetails,
         retries=3,
-        system_prompt=(
-            "You are an intelligent customer support agent. "
-            "Analyze queries carefully and provide structured responses. "
-            "Always great the customer and provide a helpful response."
-        ),
+        system_prompt=DEPENDENCIES_SYSTEM_PROMPT,
     )
 
     # Add dynamic system prompt based on dependencies
-    @agent5.system_prompt
+    @agent.system_prompt
     async def add_customer_name(ctx: RunContext[CustomerDetails]) -> str:
-        return f"Customer details: {to_markdown(ctx.deps)}"
+        return f"Customer details: {ctx.deps.markdown}"
+
+    return agent
+
+async def run_dependencies_example():
+    """Run the dependencies example"""
+    print("Running Dependencies Example...")
+    
+    agent5 = _dependencies_agent()
 
     customer = CustomerDetails(
         customer_id="1",
@@ -153,88 +511,75 @@ def run_dependencies_example():
         ],
     )
 
-    response = agent5.run_sync(user_prompt="What did I order?", deps=customer)
+    response = await cached_run(
+        agent5,
+        "What did I order?",
+        deps=customer,
+        result_type=ResponseModel,
+    )
 
     print("All messages:")
     print(response.all_messages())
     
-    print("\nStructured response:")
-    print(response.data.model_dump_json(indent=2))
-
-    print(
-        "\nCustomer Details:\n"
-        f"Name: {customer.name}\n"
-        f"Email: {customer.email}\n\n"
-        "Response Details:\n"
-        f"{response.data.response}\n\n"
-        "Status:\n"
-        f"Follow-up Required: {response.data.follow_up_required}\n"
-        f"Needs Escalation: {response.data.needs_escalation}"
-    )
+    print_response_details(customer, response.data)
 
-# Uncomment to run
-# run_dependencies_example()
+    return response
 
 # ===============================================================
 # 4. Agent with Tools
 # ===============================================================
 
-def run_tools_example():
-    """Run the tools example"""
-    print("Running Tools Example...")
-    
-    class ResponseModel(BaseModel):
-        """Structured response with metadata."""
-
-        response: str
-        needs_escalation: bool
-        follow_up_required: bool
-        sentiment: str = Field(description="Customer sentiment analysis")
-
-    # Define order schema
-    class Order(BaseModel):
-        """Structure for order details."""
-
-        order_id: str
-        status: str
-        items: List[str]
-
-    # Define customer schema
-    class CustomerDetails(BaseModel):
-        """Structure for incoming customer queries."""
-
-        customer_id: str
-        name: str
-        email: str
-        orders: Optional[List[Order]] = None
-
-    shipping_info_db: Dict[str, str] = {
+# Read-only shipping lookup, built once at import time
+shipping_info_db: Mapping[str, str] = MappingProxyType(
+    {
         "12345": "Shipped on 2024-12-01",
         "67890": "Out for delivery",
     }
+)
+
+@lru_cache(maxsize=None)
+def _shipping_tool():
+    """Build the shipping tool once so its JSON schema is derived once per process"""
+    from pydantic_ai import RunContext, Tool
 
-    def get_shipping_info(ctx: RunContext[CustomerDetails]) -> str:
+    async def get_shipping_info(ctx: RunContext[CustomerDetails]) -> str:
         """Get the customer's shipping information."""
-        return shipping_info_db[ctx.deps.orders[0].order_id]
+        if not ctx.deps.orders:
+            return "No orders found for this customer"
+        return shipping_info_db.get(
+            ctx.deps.orders[0].order_id, "No shipping info found for this order"
+        )
+
+    return Tool(get_shipping_info, takes_ctx=True)
+
+TOOLS_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT + " Use tools to look up relevant information."
+
+@lru_cache(maxsize=None)
+def _tools_agent():
+    """Build the tools agent once so its tools and system prompt are registered once"""
+    from pydantic_ai import Agent, RunContext
 
     # Agent with structured output and dependencies
-    agent5 = Agent(
-        model=model,
+    agent = Agent(
+        model=_model(),
         result_type=ResponseModel,
         deps_type=CustomerDetails,
         retries=3,
-        system_prompt=(
-            "You are an intelligent customer support agent. "
-            "Analyze queries carefully and provide structured responses. "
-            "Use tools to look up relevant information."
-            "Always great the customer and provide a helpful response."
-        ),
-        tools=[Tool(get_shipping_info, takes_ctx=True)],
+        system_prompt=TOOLS_SYSTEM_PROMPT,
+        tools=[_shipping_tool()],
     )
 
-    @agent5.system_prompt
+    @agent.system_prompt
     async def add_customer_name(ctx: RunContext[CustomerDetails]) -> str:
-        return f"Customer details: {to_markdown(ctx.deps)}"
+        return f"Customer details: {ctx.deps.markdown}"
+
+    return agent
+
+async def run_tools_example():
+    """Run the tools example"""
+    print("Running Tools Example...")
+    
+    agent5 = _tools_agent()
 
     customer = CustomerDetails(
         customer_id="1",
@@ -245,38 +590,85 @@ def run_tools_example():
         ],
     )
 
-    response = agent5.run_sync(
-        user_prompt="What's the status of my last order?", deps=customer
+    response = await cached_run(
+        agent5,
+        "What's the status of my last order?",
+        deps=customer,
+        result_type=ResponseModel,
     )
 
     print("All messages:")
     print(response.all_messages())
     
-    print("\nStructured response:")
-    print(response.data.model_dump_json(indent=2))
+    print_response_details(customer, response.data)
 
-    print(
-        "\nCustomer Details:\n"
-        f"Name: {customer.name}\n"
-        f"Email: {customer.email}\n\n"
-        "Response Details:\n"
-        f"{response.data.response}\n\n"
-        "Status:\n"
-        f"Follow-up Required: {response.data.follow_up_required}\n"
-        f"Needs Escalation: {response.data.needs_escalation}"
-    )
-
-# Uncomment to run
-# run_tools_example()
+    return response
 
 # ===============================================================
-# Run the desired example(s) by uncommenting the calls below
+# Run the selected example(s)
 # ===============================================================
 
-# Uncomment the example you want to run
-# run_simple_agent()
-# run_structured_response()
-# run_dependencies_example()
-# run_tools_example()
+async def main(example="all", batch_size=1):
+    """Run one example, or all of them concurrently so their requests overlap
+
+    A batch_size above 1 sends that many copies of the example prompt through
+    run_batch for the simple and structured examples.
+    """
+    if EXAMPLES_MODE == "batch" and (batch_size <= 1 or example in ("deps", "tools")):
+        print(
+            "EXAMPLES_MODE=batch only applies to the simple example with "
+            "--batch-size above 1; running live"
+        )
+
+    # Streaming is off for "all" since concurrent examples would interleave chunks
+    stream = example != "all"
+    prompts = ["How can I track my order #12345?"] * batch_size if batch_size > 1 else None
+    examples = {
+        "simple": lambda: run_simple_agent(prompts=prompts, stream=stream),
+        "structured": lambda: run_structured_response(prompts=prompts, stream=stream),
+        "deps": run_dependencies_example,
+        "tools": run_tools_example,
+    }
+    if example != "all":
+        return await examples[example]()
+    return await asyncio.gather(*(run() for run in examples.values()))
+
+
+if __name__ == "__main__":
+    import argparse
 
-print("To run an example, edit this file and uncomment one of the function calls at the bottom.") 
\ No newline at end of file
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        epilog=(
+            "Environment: EXAMPLES_MODE=batch sends the simple example's prompts "
+            "through OpenAI's Batch API when --batch-size is above 1; every other "
+            "example and batch size runs live. AGENT_CACHE=0 disables the result cache."
+        ),
+    )
+    parser.add_argument(
+        "--example",
+        choices=["simple", "structured", "deps", "tools", "all"],
+        default="all",
+        help="example to run (default: all, concurrently)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="copies of the prompt to run as a batch in the simple/structured examples",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always call the model instead of reusing results from .agent_cache",
+    )
+    args = parser.parse_args()
+    if args.no_cache:
+        USE_CACHE = False
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main(args.example, args.batch_size))
+    else:
+        uvloop.run(main(args.example, args.batch_size))
@@ -0,0 +1,191 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import run_interactive
+
+
+RESPONSE = {
+    "response": "You can track order #12345 from your account page.",
+    "needs_escalation": False,
+    "follow_up_required": False,
+    "sentiment": "neutral",
+}
+
+
+async def stream_response_model(messages, info: AgentInfo):
+    """Stream the ResponseModel tool call in small chunks, like a real model"""
+    args = json.dumps(RESPONSE)
+    yield {0: DeltaToolCall(name=info.result_tools[0].name)}
+    for i in range(0, len(args), 8):
+        yield {0: DeltaToolCall(json_args=args[i:i + 8])}
+
+
+def respond_with_response_model(messages, info: AgentInfo):
+    """Answer in one response with the ResponseModel tool call"""
+    return ModelResponse(
+        parts=[ToolCallPart.from_json(info.result_tools[0].name, json.dumps(RESPONSE))]
+    )
+
+
+def test_simple_agent_stream_records_reply_in_history(monkeypatch, capsys):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = run_interactive._simple_agent()
+    reply = "Use the tracking link in your confirmation email."
+
+    async def stream_text(messages, info: AgentInfo):
+        first, *rest = reply.split(" ")
+        yield first
+        for word in rest:
+            yield " " + word
+
+    with agent.override(model=FunctionModel(stream_function=stream_text)):
+        response = asyncio.run(run_interactive.run_simple_agent(stream=True))
+
+    assert isinstance(response.all_messages()[-1], ModelResponse)
+    assert response.all_messages()[-1].parts[0].content == reply
+    assert isinstance(response.new_messages()[-1], ModelResponse)
+    assert f"Response data:\n{reply}\n" in capsys.readouterr().out
+
+
+def test_structured_response_streams_partial_results(monkeypatch, capsys):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = run_interactive._structured_agent()
+    outputs = []
+
+    async def stream_and_capture(messages, info: AgentInfo):
+        # Record what has been printed before the model sends its last chunk
+        async for chunk in stream_response_model(messages, info):
+            outputs.append(capsys.readouterr().out)
+            yield chunk
+
+    with agent.override(model=FunctionModel(stream_function=stream_and_capture)):
+        asyncio.run(run_interactive.run_structured_response(stream=True))
+
+    header = "Running Structured Response Example...\n"
+    fragments = [out for out in outputs[:-1] if out and out != header]
+    assert len(fragments) > 1
+    assert fragments[0] != RESPONSE["response"]
+    assert RESPONSE["response"].startswith(fragments[0])
+
+    out = "".join(outputs) + capsys.readouterr().out
+    streamed, structured = out.split("Structured response:\n", 1)
+    assert streamed.endswith(RESPONSE["response"] + "\n")
+    assert json.loads(structured) == RESPONSE
+
+
+def test_cached_run_reuses_result_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(run_interactive, "_CACHE_PATH", str(tmp_path / "cache"))
+    calls = []
+
+    def respond(messages, info: AgentInfo):
+        calls.append(messages)
+        return respond_with_response_model(messages, info)
+
+    agent = run_interactive._structured_agent()
+    run = lambda: run_interactive.cached_run(
+        agent, "Where is my order?", result_type=run_interactive.ResponseModel
+    )
+    with agent.override(model=FunctionModel(respond)):
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert second.data == first.data
+    assert second.all_messages() == first.all_messages()
+    assert second.new_messages() == first.new_messages()
+    assert second.cost() == first.cost()
+
+
+def test_cached_run_treats_unreadable_entry_as_miss(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(run_interactive, "_CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(run_interactive, "_load_result", lambda entry, result_type: 1 / 0)
+
+    agent = run_interactive._structured_agent()
+    run = lambda: run_interactive.cached_run(
+        agent, "Where is my order?", result_type=run_interactive.ResponseModel
+    )
+    with agent.override(model=FunctionModel(respond_with_response_model)):
+        asyncio.run(run())
+        response = asyncio.run(run())
+
+    assert response.data.model_dump() == RESPONSE
+
+
+def test_cached_run_returns_result_when_cache_cannot_be_written(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+    def unavailable(*args, **kwargs):
+        raise OSError("read-only cache directory")
+
+    monkeypatch.setattr(run_interactive.shelve, "open", unavailable)
+
+    agent = run_interactive._structured_agent()
+    with agent.override(model=FunctionModel(respond_with_response_model)):
+        response = asyncio.run(
+            run_interactive.cached_run(
+                agent, "Where is my order?", result_type=run_interactive.ResponseModel
+            )
+        )
+
+    assert response.data.model_dump() == RESPONSE
+
+
+def test_cached_run_keys_on_the_agents_system_prompt(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(run_interactive, "_CACHE_PATH", str(tmp_path / "cache"))
+    calls = []
+
+    def respond(messages, info: AgentInfo):
+        calls.append(messages)
+        return respond_with_response_model(messages, info)
+
+    model = FunctionModel(respond)
+    for system_prompt in ("Be brief.", "Be thorough."):
+        agent = Agent(
+            model=model,
+            result_type=run_interactive.ResponseModel,
+            system_prompt=system_prompt,
+        )
+        asyncio.run(
+            run_interactive.cached_run(
+                agent, "Where is my order?", result_type=run_interactive.ResponseModel
+            )
+        )
+
+    assert len(calls) == 2
+
+
+def test_customer_details_cached_renderings_follow_copies():
+    customer = run_interactive.CustomerDetails(
+        customer_id="1",
+        name="John Doe",
+        email="john.doe@example.com",
+        orders=[run_interactive.Order(order_id="12345", status="shipped", items=["Blue Jeans"])],
+    )
+    assert customer.dump["name"] == "John Doe"
+    assert customer.dump["orders"][0]["items"] == ["Blue Jeans"]
+    assert "John Doe" in customer.markdown
+    assert "- Blue Jeans" in customer.markdown
+
+    with pytest.raises(ValidationError):
+        customer.name = "Jane Doe"
+    with pytest.raises(AttributeError):
+        customer.orders.append(customer.orders[0])
+    with pytest.raises(AttributeError):
+        customer.orders[0].items.append("T-Shirt")
+
+    renamed = customer.model_copy(update={"name": "Jane Doe"})
+    assert renamed.dump["name"] == "Jane Doe"
+    assert "Jane Doe" in renamed.markdown
+    assert customer.dump["name"] == "John Doe"